@@ -1,16 +1,22 @@
 #!/usr/bin/env python3
 
-import jinja2
+import glob
+import hashlib
+import itertools
 import json
 import math
 import os
+import pathlib
 import re
+import shlex
 import shutil
 import subprocess
 import tempfile
+import threading
 import time
 import yaml
 import contextlib
+from concurrent.futures import ThreadPoolExecutor
 from typing import Tuple
 from argparse import ArgumentParser
 import config
@@ -26,7 +32,6 @@ from common import (
     zephyr_config_to_list,
     get_versions,
     get_yaml_data,
-    calculate_md5,
     conv_zephyr_mem_usage,
     get_dts_include_chain,
     sanitize_lower,
@@ -34,12 +39,34 @@ from common import (
     get_sample_workspace,
     get_sample_extra_args,
     get_dts_by_identifier,
+    get_resolved_board_file,
+    get_template,
+    copy_file,
+    publish_file,
+    publish_file_with_md5,
+    read_json_cache,
+    write_json_cache,
+    SafeLoader,
+    CACHE_DIR,
 )
 
-templateLoader = jinja2.FileSystemLoader(searchpath="./")
-templateEnv = jinja2.Environment(loader=templateLoader)
+# Resolved board identifiers
+IDENTIFIER_INDEX_DIR = os.path.join(CACHE_DIR, "identifier_index")
 
-dts_overlay_template = templateEnv.get_template('templates/overlay.dts')
+
+def render_overlay(regions: list) -> str:
+    """
+    Render the memory overlay template by calling its compiled render function directly.
+
+    Args:
+        regions (list): List of (node name, node base, node size) tuples.
+
+    Returns:
+        str: The rendered overlay.
+    """
+    template = get_template('templates/overlay.dts')
+    context = template.new_context({'regions': regions})
+    return ''.join(template.root_render_func(context))
 
 
 @contextlib.contextmanager
@@ -74,10 +101,14 @@ class SampleBuilder:
 
         self.dts_modified = False
         self.dts_original = tempfile.mkstemp(suffix='_dts_original', text=True)[1]
+        self.memory_overlay = tempfile.mkstemp(suffix='_memory.overlay', text=True)[1]
 
         self.success = False
         self.arch_bits = 32
 
+        # Artifacts found after the last build, invalidated by every `_build` call
+        self._artifacts_cache = None
+
     # Constants
     ARTIFACTS = {
         "elf": "zephyr/zephyr.elf",
@@ -88,20 +119,31 @@ class SampleBuilder:
         "spdx_zephyr": "spdx/zephyr.spdx"
     }
 
-    _MEMORY_EXTENSION_REGEX = r"region `(\S+)' overflowed by (\d+) bytes"
-    _MEMORY_USAGE_REGEX = r"(?P<region>\w+){1}:\s*(?P<used>\d+\s+\w{1,2})\s*(?P<size>\d+\s+\w{1,2})\s*(?P<percentage>\d+.\d+%)"
-    _ARCH_ERROR_REGEX = r"Arch .*? not supported"
+    # West output is kept as bytes, the patterns are pure ASCII
+    _MEMORY_EXTENSION_RE = re.compile(rb"region `(\S+)' overflowed by (\d+) bytes")
+    _MEMORY_USAGE_RE = re.compile(rb"(?P<region>\w+){1}:\s*(?P<used>\d+\s+\w{1,2})\s*(?P<size>\d+\s+\w{1,2})\s*(?P<percentage>\d+.\d+%)")
+    _ARCH_ERROR_RE = re.compile(rb"Arch .*? not supported")
 
     def __del__(self):
-        # Remove the temporary build directory
-        if os.path.isdir(self.temp_dir_path):
-            shutil.rmtree(self.temp_dir_path)
+        # Remove the temporary build directory, it may be already removed by `remove_build_dir`
+        shutil.rmtree(self.temp_dir_path, ignore_errors=True)
 
         # Remove temporary files
-        for file in [self.log_file, self.dts_original]:
+        for file in [self.log_file, self.dts_original, self.memory_overlay]:
             if os.path.isfile(file):
                 os.remove(file)
 
+    def remove_build_dir(self) -> threading.Thread:
+        """
+            Remove the temporary build directory in a background thread.
+
+            Returns:
+            threading.Thread: The started thread removing the directory.
+        """
+        thread = threading.Thread(target=shutil.rmtree, args=(self.temp_dir_path,), kwargs={'ignore_errors': True})
+        thread.start()
+        return thread
+
     def build_sample(self) -> dict:
         """
             Build a Zephyr sample with optional memory size extension
@@ -123,16 +165,17 @@ class SampleBuilder:
                 self._copy_original_dts_file(original_dts)
 
         fail, west_output = self._build()
+        arifacts = self.get_artifacts()
 
         if fail:
-            fail = self._check_extend_memory(west_output)
+            fail = self._check_extend_memory(west_output, arifacts)
+            # the sample may have been rebuilt
+            arifacts = self.get_artifacts()
 
-        arifacts = self.get_artifacts()
-
-        self.success = (not fail) and ("elf" in arifacts) and self._check_kconfig_requirements()
+        self.success = (not fail) and ("elf" in arifacts) and self._check_kconfig_requirements(arifacts)
 
         self.arch_bits = 32
-        if self._check_if_64bit():
+        if self._check_if_64bit(arifacts):
             self.arch_bits = 64
 
         return arifacts
@@ -144,13 +187,15 @@ class SampleBuilder:
             Returns:
                 str: filename if an ELF exists, otherwise None.
         """
+        ignored = ("zephyr_pre0.elf", "zephyr_pre1.elf")
 
-        for root, _, files in os.walk(self.temp_dir_path):
-            for _file in files:
-                if _file.endswith(".elf") and _file not in ["zephyr_pre0.elf", "zephyr_pre1.elf"]:
-                    return os.path.join(root, _file)
+        # Probe the Zephyr output directory first, only then fall back to the whole build tree
+        candidates = itertools.chain(
+            sorted(glob.iglob(f"{self.temp_dir_path}/zephyr/*.elf")),
+            (str(p) for p in pathlib.Path(self.temp_dir_path).rglob("*.elf")),
+        )
 
-        return None
+        return next((c for c in candidates if os.path.basename(c) not in ignored), None)
 
     def get_artifacts(self) -> dict:
         """
@@ -159,19 +204,31 @@ class SampleBuilder:
             Returns:
             dict: A dictionary containing the names and paths of the existing artifacts.
         """
+        if self._artifacts_cache is not None:
+            return dict(self._artifacts_cache)
+
+        # List each artifact directory once instead of checking every artifact separately
+        found = set()
+        for subdir in {os.path.dirname(path) for path in self.ARTIFACTS.values()}:
+            try:
+                with os.scandir(f"{self.temp_dir_path}/{subdir}") as entries:
+                    found.update(f"{subdir}/{entry.name}" for entry in entries)
+            except FileNotFoundError:
+                pass
+
         artifacts = {}
 
         for name, path in self.ARTIFACTS.items():
-            expanded_path = f"{self.temp_dir_path}/{path}"
-            if os.path.exists(expanded_path):
-                artifacts[name] = expanded_path
+            if path in found:
+                artifacts[name] = f"{self.temp_dir_path}/{path}"
 
         # Platforms may change the default name of the ELF artifact (`esp32s3_devkitm_appcpu`).
         if ("elf" not in artifacts) and (candidate := self._find_elf_file()):
             print(f"zephyr.elf not found! Trying to use: {candidate}")
             artifacts["elf"] = candidate
 
-        return artifacts
+        self._artifacts_cache = artifacts
+        return dict(artifacts)
 
     def get_memory_usage(self) -> dict | None:
         """
@@ -187,16 +244,17 @@ class SampleBuilder:
             return None
 
         memory = {}
-        with open(self.log_file) as f:
-            match = re.findall(self._MEMORY_USAGE_REGEX, f.read())
 
         # Get memory usage statistics
-        for m in match:
-            region, used, size, _ = m
-            memory[region] = {
-                'used': conv_zephyr_mem_usage(used),
-                'size': conv_zephyr_mem_usage(size),
-            }
+        # The log is scanned line by line, as Zephyr prints one region per line.
+        # Later builds (memory extension) overwrite the entries of the previous ones.
+        with open(self.log_file, 'rb') as f:
+            for line in f:
+                if m := self._MEMORY_USAGE_RE.search(line):
+                    memory[m['region'].decode()] = {
+                        'used': conv_zephyr_mem_usage(m['used'].decode()),
+                        'size': conv_zephyr_mem_usage(m['size'].decode()),
+                    }
 
         # Check if flash size was increased
         if "memory" in self.overlays:
@@ -220,35 +278,40 @@ class SampleBuilder:
         """
         if not self.dts_modified:
             print(f"Preserving original DTS file at {dts_original_path}")
-            shutil.copyfile(dts_original_path, self.dts_original)
+            copy_file(dts_original_path, self.dts_original)
 
-    def _run_command(self, cmd: str) -> Tuple[bool, str]:
+    def _run_command(self, cmd: list[str]) -> Tuple[bool, bytes]:
         """
             Runs a specified west command.
 
+            The output is written by the command directly to the log file,
+            it is only read back from there if the command failed.
+
             Parameters:
-            cmd (str): The west command to be run.
+            cmd (list[str]): The west command to be run, as an argument list.
 
             Returns:
             bool: True if the command failed, False otherwise.
-            str: The output from the executed command.
+            bytes: The raw output from the executed command if it failed, empty otherwise.
         """
-        failed = False
-        output = ""
+        if self.log_file is None:
+            process = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+            failed = process.returncode != 0
+            return (failed, process.stdout if failed else b'')
 
-        try:
-            output = subprocess.check_output((cmd.split(" ")), stderr=subprocess.STDOUT).decode()
-        except subprocess.CalledProcessError as error:
-            failed = True
-            output = error.output.decode()
+        with open(self.log_file, 'ab') as file:
+            start = file.tell()
+            failed = subprocess.call(cmd, stdout=file, stderr=subprocess.STDOUT) != 0
 
-        if self.log_file is not None:
-            with open(self.log_file, 'a') as file:
-                file.write(output)
+        output = b''
+        if failed:
+            with open(self.log_file, 'rb') as file:
+                file.seek(start)
+                output = file.read()
 
         return (failed, output)
 
-    def _build(self, pristine: bool = True, prepare_only: bool = False, disable_overlays: bool = False) -> Tuple[bool, str]:
+    def _build(self, pristine: bool = True, prepare_only: bool = False, disable_overlays: bool = False) -> Tuple[bool, bytes]:
         """
             Build the Zephyr project with optional configurations.
 
@@ -258,8 +321,8 @@ class SampleBuilder:
             disable_overlays (bool, optional): If True, disable overlays in the build. Default is False.
 
             Returns:
-            Tuple[bool, str]: A tuple containing a boolean indicating build success (True if failed) and
-            a string with the build output or error message.
+            Tuple[bool, bytes]: A tuple containing a boolean indicating build success (True if failed) and
+            the raw build output or error message, if the build failed.
         """
 
         # Save information about tainted DTS file
@@ -270,10 +333,12 @@ class SampleBuilder:
             os.chdir(self.sample_workspace)
 
             # Concentrate overlay and base args
-            build_args = (' '.join(list(self.args.values())) if self.args else '') + (' -DDTC_OVERLAY_FILE=' + ';'.join(list(self.overlays.values())) if self.overlays and not disable_overlays else '')
+            build_args = [arg for value in self.args.values() for arg in shlex.split(value)]
+            if self.overlays and not disable_overlays:
+                build_args.append('-DDTC_OVERLAY_FILE=' + ';'.join(self.overlays.values()))
 
             # Print arguments
-            print(f"Building with {bold('args')}: {build_args}")
+            print(f"Building with {bold('args')}: {shlex.join(build_args)}")
 
             # Remove the `BUILD_DIR` before building
             # Required for correct SPDX generation, as without this, the SPDX files
@@ -282,22 +347,24 @@ class SampleBuilder:
                 shutil.rmtree(self.temp_dir_path)
 
             # Build the sample in the `temp_dir_path`
-            build_command = (
-                "west build "
-                f"-b {self.platform} "
-                f"-d {self.temp_dir_path} "
-                f"{self.sample_path} "
-                f"{build_args} "
-                f"{'--pristine' if pristine else ''} "
-                "-DCONFIG_BUILD_OUTPUT_META=y "  # Since Zephyr 7bde51b this config must be enabled to generate spdx files
-            ).strip()
+            build_command = [
+                "west", "build",
+                "-b", self.platform,
+                "-d", self.temp_dir_path,
+                self.sample_path,
+                *build_args,
+                *(["--pristine"] if pristine else []),
+                "-DCONFIG_BUILD_OUTPUT_META=y",  # Since Zephyr 7bde51b this config must be enabled to generate spdx files
+            ]
 
             if prepare_only:
-                failed, output = self._run_command(f"{build_command} --cmake-only")
+                failed, output = self._run_command([*build_command, "--cmake-only"])
             else:
-                self._run_command(f"west spdx --init -d {self.temp_dir_path}")
+                self._run_command(["west", "spdx", "--init", "-d", self.temp_dir_path])
                 failed, output = self._run_command(build_command)
-                self._run_command(f"west spdx -d {self.temp_dir_path}")
+                self._run_command(["west", "spdx", "-d", self.temp_dir_path])
+
+            self._artifacts_cache = None
 
             return failed, output
 
@@ -331,17 +398,23 @@ class SampleBuilder:
         Prepares memory node entries based on west errors and the DTS file.
 
         Args:
-        west_output (str): West build output.
+        west_output (bytes): West build output.
         dts_filename (str): Path to the DTS file.
 
         Returns:
+        list: Overflowed regions found in the west output, as (log node name, overflow) tuples.
         dict: Dictionary with log node names as keys and tuples as values.
-        None, if no occurrences are found or if the DTS file does not exist.
+        None instead of the dictionary, if no occurrences are found or if the DTS file does not exist.
         """
-        occurrences = re.findall(self._MEMORY_EXTENSION_REGEX, west_output)
+        # Cheap substring check before scanning the whole log with a regex
+        if b"overflowed by" not in west_output:
+            return [], None
+
+        # Only the captured groups are decoded, not the whole output
+        occurrences = [(name.decode(), size.decode()) for name, size in self._MEMORY_EXTENSION_RE.findall(west_output)]
 
         if occurrences == [] or not os.path.exists(dts_filename):
-            return
+            return occurrences, None
 
         sizes = {}
         for m in occurrences:
@@ -350,59 +423,53 @@ class SampleBuilder:
             decoded_node_name, decoded_node_base, decoded_node_size = decode_node(node_name, dts_filename)
             if decoded_node_name is None:
                 print(f"No node {node_name} found when trying to resize it")
-                return
+                return occurrences, None
 
             if decoded_node_size is None:
                 print(f"Unable to parse enough information out of node {node_name} to increase its size, aborting")
-                return
+                return occurrences, None
 
             sizes[log_node_name] = (decoded_node_name, decoded_node_base, decoded_node_size)
 
-        return sizes
+        return occurrences, sizes
 
     def _generate_overlay_file(self, sizes):
         """
         Generates a file with an overlay that will increase required sizes.
+        The same file is rewritten on every memory extension attempt.
 
         Args:
         sizes (dict): Dictionary with log node names as keys and tuples as values.
 
         Returns:
-        str: Temporary file name.
+        str: Overlay file name.
         """
-        with tempfile.NamedTemporaryFile(mode='w', encoding='utf-8', delete=False) as f:
+        with open(self.memory_overlay, 'w', encoding='utf-8') as f:
             # create an overlay
-            for log_node_name in sizes:
-                node_name, node_base, node_size = sizes[log_node_name]
-                f.write(dts_overlay_template.render(
-                    reg_name=node_name,
-                    reg_base=node_base,
-                    reg_size=node_size
-                ))
-            f.flush()
-            return f.name
-
-    def _check_extend_memory(self, west_output: str) -> bool:
+            f.write(render_overlay(list(sizes.values())))
+        return self.memory_overlay
+
+    def _check_extend_memory(self, west_output: bytes, artifacts: dict) -> bool:
         """
             Check and extend memory node size if necessary for a given run.
 
             Args:
-            west_output (str): The output of the west build tool
+            west_output (bytes): The output of the west build tool
+            artifacts (dict): Artifacts of the failed build
 
             Returns:
             boolean indicating build success (True if failed)
         """
-        dts_filename = self.get_artifacts().get("dts", None)
+        dts_filename = artifacts.get("dts", None)
         if not dts_filename:
             print("Build failed. DTS file is not present. Aborting!")
             return True
 
-        arch_err = re.findall(self._ARCH_ERROR_REGEX, west_output)
-        if arch_err:
+        if b"not supported" in west_output and self._ARCH_ERROR_RE.search(west_output):
             print("Build failed. Arch not supported. Aborting!")
             return True
 
-        sizes = self._prepare_node_entries(west_output, dts_filename)
+        occurrences, sizes = self._prepare_node_entries(west_output, dts_filename)
         if not sizes:
             print("Build failed. Size is not the issue. Aborting!")
             return True
@@ -413,20 +480,6 @@ class SampleBuilder:
         last_occurrences = []
         fail = True
         while fail:
-
-            occurrences = re.findall(self._MEMORY_EXTENSION_REGEX, west_output)
-
-            n_sizes = self._prepare_node_entries(west_output, dts_filename)
-            if not n_sizes:
-                print("Build failed. Size is not the issue. Aborting!")
-                return True
-
-            sizes.update(n_sizes)
-
-            if occurrences == []:
-                print(f"Build failed. Attempted node size increases: {sizes}. Aborting!")
-                return True
-
             if last_occurrences == occurrences:
                 print("Resizing didn't change any value in linker output. Failing!")
                 return True
@@ -453,11 +506,20 @@ class SampleBuilder:
             self.overlays["memory"] = overlay_path
             fail, west_output = self._build()
 
+            if fail:
+                # reuse the occurrences found while preparing the node entries in the next iteration
+                occurrences, n_sizes = self._prepare_node_entries(west_output, dts_filename)
+                if not n_sizes:
+                    print("Build failed. Size is not the issue. Aborting!")
+                    return True
+
+                sizes.update(n_sizes)
+
         return fail
 
-    def _check_if_64bit(self):
+    def _check_if_64bit(self, artifacts: dict):
         try:
-            zephyr_config_file = self.get_artifacts()["config"]
+            zephyr_config_file = artifacts["config"]
 
             with open(zephyr_config_file) as f:
                 zephyr_config = f.read().splitlines()
@@ -471,7 +533,7 @@ class SampleBuilder:
 
         return False
 
-    def _check_kconfig_requirements(self):
+    def _check_kconfig_requirements(self, artifacts: dict):
         """
         Check if the config file generated for this board has symbols set to the
         required status.
@@ -484,17 +546,15 @@ class SampleBuilder:
             # There are no requirements for this sample.
             return ret
 
-        zephyr_config_file = self.get_artifacts()["config"]
+        zephyr_config_file = artifacts["config"]
 
         with open(zephyr_config_file) as f:
-            zephyr_config = f.read().splitlines()
+            zephyr_config = frozenset(f.read().splitlines())
 
         for symbol in symbols:
             print(f"Checking for {bold(symbol)} in {bold(zephyr_config_file)}... ", end="")
-            for l in zephyr_config:
-                if l == symbol:
-                    print(bold(green("Found!")))
-                    break
+            if symbol in zephyr_config:
+                print(bold(green("Found!")))
             else:
                 print(bold(red("Not found!")))
                 ret = False
@@ -509,24 +569,73 @@ def get_full_name(yaml_data):
 
 
 def get_board_yaml_path_by_identifier(board_dir: str, board_name: str) -> str:
+    """
+    Find the .yaml file inside `board_dir` whose identifier matches the board_name.
+
+    The board resolution generated by `resolve_boards.py` is used first, if available.
+    Resolved identifiers are stored in an index under `IDENTIFIER_INDEX_DIR` for the current
+    Zephyr version, so that subsequent builds for the same board skip the lookup.
+    In case no matches are made, raise YAMLNotFoundException.
+    """
+    # Use the file found by `resolve_boards.py`, if available
+    if resolved := get_resolved_board_file(board_dir, board_name, "yaml"):
+        return resolved
+
+    # The index is kept outside of the Zephyr checkout, one file per board directory
+    index_key = os.path.abspath(board_dir)
+    index_path = os.path.join(IDENTIFIER_INDEX_DIR, hashlib.sha1(index_key.encode()).hexdigest() + ".json")
+    version = get_versions()["zephyr"]
+
+    index_cache_key = {"board_dir": index_key, "version": version}
+    index = read_json_cache(index_path, index_cache_key) or {}
+
+    if board_name in index and os.path.exists(index[board_name]):
+        return index[board_name]
+
+    yaml_path = find_board_yaml_path_by_identifier(board_dir, board_name)
+
+    index[board_name] = yaml_path
+    if not write_json_cache(index_path, index_cache_key, index):
+        print(f"Unable to save the identifier index {index_path}")
+
+    return yaml_path
+
+
+def find_board_yaml_path_by_identifier(board_dir: str, board_name: str) -> str:
     """
     Attempt to parse all .yaml files inside `board_dir`.
     If any yaml file identifier matches the board_name -> return yaml file location,
     In case no matches are made, raise YAMLNotFoundException.
     """
+    # Most of the time the yaml file is named after the sanitized identifier, try it first
+    candidate = os.path.join(board_dir, f'{sanitize_lower(board_name)}.yaml')
+    if os.path.exists(candidate):
+        with open(candidate, 'r') as f:
+            try:
+                if yaml.load(f, Loader=SafeLoader)['identifier'] == board_name:
+                    return candidate
+            except (yaml.YAMLError, KeyError, TypeError):
+                pass
+
     for root, dirs, files in os.walk(board_dir):
         for file in files:
             if file.endswith('.yaml'):
                 file_path = os.path.join(root, file)
                 with open(file_path, 'r') as f:
-                    try:
-                        data = yaml.safe_load(f)
-                        if data['identifier'] == board_name:
-                            return file_path
-                    except yaml.YAMLError as e:
-                        print(f"Error reading {file_path}: {e}")
-                    except KeyError as e:
-                        print(f"No identifier key in: {file_path}: {e}")
+                    content = f.read()
+
+                # Skip the YAML parsing if the identifier is not mentioned at all
+                if board_name not in content:
+                    continue
+
+                try:
+                    data = yaml.load(content, Loader=SafeLoader)
+                    if data['identifier'] == board_name:
+                        return file_path
+                except yaml.YAMLError as e:
+                    print(f"Error reading {file_path}: {e}")
+                except KeyError as e:
+                    print(f"No identifier key in: {file_path}: {e}")
 
     raise YAMLNotFoundException
 
@@ -559,7 +668,7 @@ def main(board_dir: str, board_name: str, sample_name: str) -> None:
 
     # Check for sample prj.conf overlay
     if os.path.exists(config_path):
-        run.args["config"] = f'-DCONF_FILE={os.path.realpath(config_path)}'
+        run.args["config"] = f'-DCONF_FILE={shlex.quote(os.path.realpath(config_path))}'
 
     if sample_extra_args:
         run.args["extra_args"] = sample_extra_args
@@ -581,81 +690,105 @@ def main(board_dir: str, board_name: str, sample_name: str) -> None:
     # Create artifacts location
     os.makedirs(f"build/{project_sample_name}", exist_ok=True)
 
+    # The ELF is hashed while being published, for the MD5 artifact
+    elf_copy = None
+
     # Save logs
-    shutil.copyfile(run.log_file, f"build/{project_sample_name}/{sample_name}.log")
+    # The log and the original DTS are private temporary files, they are copied instead of linked
+    copies = [(run.log_file, f"build/{project_sample_name}/{sample_name}.log", False)]
 
     # Save original DTS
     if run.dts_modified:
-        shutil.copyfile(run.dts_original, f"build/{project_sample_name}/{sample_name}.dts.orig")
+        copies.append((run.dts_original, f"build/{project_sample_name}/{sample_name}.dts.orig", False))
 
     for key, path in artifacts.items():
         if re.search("spdx.+", key):
             filename = os.path.basename(path)
-            shutil.copyfile(path, f"build/{project_sample_name}/{sample_name}-{filename}")
+            copies.append((path, f"build/{project_sample_name}/{sample_name}-{filename}", True))
         elif key == "elf":
-            shutil.copyfile(path, f"build/{project_sample_name}/{sample_name}.elf")
+            elf_copy = (path, f"build/{project_sample_name}/{sample_name}.elf")
         elif key == "dts":
-            shutil.copyfile(path, f"build/{project_sample_name}/{sample_name}.dts")
+            copies.append((path, f"build/{project_sample_name}/{sample_name}.dts", True))
         elif key == "config":
-            shutil.copyfile(path, f"build/{project_sample_name}/{sample_name}-config")
+            copies.append((path, f"build/{project_sample_name}/{sample_name}-config", True))
 
-    format_args = {
-        "board_name": board_name_sanitized,
-        "sample_name": sample_name,
-    }
+    # The copies are independent from each other, file I/O releases the GIL
+    # The pool is kept for creating the SBOM archive while the build results are collected
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        elf_md5 = executor.submit(publish_file_with_md5, *elf_copy) if elf_copy else None
+        list(executor.map(publish_file, *zip(*copies)))
 
-    elf_name = config.artifact_paths["elf"].format(**format_args)
-    elf_md5_name = config.artifact_paths["elf-md5"].format(**format_args)
+        # The ELF has to be published too, before its build tree is removed
+        elf_digest = elf_md5.result() if elf_md5 else None
 
-    try:
-        board_yaml_path = get_board_yaml_path_by_identifier(board_dir, board_name)
-        board_yaml_data = get_yaml_data(board_yaml_path)
-    except YAMLNotFoundException:
-        print(bold(f"Skipping target due to missing YAML file: {board_name}"))
-        return
-
-    platform_full_name = get_full_name(board_yaml_data)
-    arch = board_yaml_data["arch"]
-
-    # XXX:
-    # * the `dts_include_chain` is used by the Renodepedia as a data input
-    # * uses _non-flattened_ device tree
-    dts_include_chain = get_dts_include_chain(arch, get_dts_by_identifier(board_dir, board_name, board_yaml_path))
-
-    result = {
-        "platform": board_name_sanitized,
-        "platform_original": board_name,
-        "sample_name": sample_name,
-        "success": run.success,
-        "extended_memory": "memory" in run.overlays,
-        "configs": zephyr_config_to_list(config_path) if run.args else None,
-        "zephyr_sha": get_versions()["zephyr"],
-        "zephyr_sdk": get_versions()["sdk"],
-        "arch": arch,
-        "platform_full_name": platform_full_name,
-        "board_dir": '/'.join(board_dir.split('/')[2:]),  # Drop 'zephyrproject/zephyr' from the path
-        "memory": run.get_memory_usage(),
-        "dts_include_chain": dts_include_chain,
-        "arch_bits" : run.arch_bits,
-        "platform_revision": revision,
-    }
+        # All artifacts are published, the build tree is no longer needed
+        run.remove_build_dir()
+
+        format_args = {
+            "board_name": board_name_sanitized,
+            "sample_name": sample_name,
+        }
+
+        # Resolve the artifact paths once for this build
+        paths = {name: path.format(**format_args) for name, path in config.artifact_paths.items()}
+
+        elf_md5_name = paths["elf-md5"]
+
+        try:
+            board_yaml_path = get_board_yaml_path_by_identifier(board_dir, board_name)
+            board_yaml_data = get_yaml_data(board_yaml_path)
+        except YAMLNotFoundException:
+            print(bold(f"Skipping target due to missing YAML file: {board_name}"))
+            return
+
+        if run.success:
+            # Create ZIP archive with sboms
+            # It only depends on the published files, create it while the build results are collected
+            sbom_zip_name = paths["zip-sbom"]
+            sbom_zip = executor.submit(create_zip_archive, sbom_zip_name, paths, files=["sbom-app", "sbom-zephyr", "sbom-build"])
+
+        platform_full_name = get_full_name(board_yaml_data)
+        arch = board_yaml_data["arch"]
+
+        # XXX:
+        # * the `dts_include_chain` is used by the Renodepedia as a data input
+        # * uses _non-flattened_ device tree
+        dts_include_chain = get_dts_include_chain(arch, get_dts_by_identifier(board_dir, board_name, board_yaml_path))
+
+        versions = get_versions()
+
+        result = {
+            "platform": board_name_sanitized,
+            "platform_original": board_name,
+            "sample_name": sample_name,
+            "success": run.success,
+            "extended_memory": "memory" in run.overlays,
+            "configs": zephyr_config_to_list(config_path) if run.args else None,
+            "zephyr_sha": versions["zephyr"],
+            "zephyr_sdk": versions["sdk"],
+            "arch": arch,
+            "platform_full_name": platform_full_name,
+            "board_dir": '/'.join(board_dir.split('/')[2:]),  # Drop 'zephyrproject/zephyr' from the path
+            "memory": run.get_memory_usage(),
+            "dts_include_chain": dts_include_chain,
+            "arch_bits" : run.arch_bits,
+            "platform_revision": revision,
+        }
 
-    info = "Success!" if run.success else "Fail!"
-    print(bold(info))
+        info = "Success!" if run.success else "Fail!"
+        print(bold(info))
 
-    # Create JSON with build results
-    results_json_name = config.artifact_paths["result"].format(**format_args)
-    with open(results_json_name, "w") as f:
-        json.dump(result, f)
+        # Create JSON with build results
+        results_json_name = paths["result"]
+        with open(results_json_name, "w") as f:
+            json.dump(result, f)
 
-    if result["success"]:
-        # Create MD5 hash file for the binary
-        with open(elf_md5_name, "w") as f:
-            f.write(calculate_md5(elf_name))
+        if result["success"]:
+            # Create MD5 hash file for the binary
+            with open(elf_md5_name, "w") as f:
+                f.write(elf_digest)
 
-        # Create ZIP archive with sboms
-        sbom_zip_name = config.artifact_paths["zip-sbom"].format(**format_args)
-        create_zip_archive(sbom_zip_name, format_args, files=["sbom-app", "sbom-zephyr", "sbom-build"])
+            sbom_zip.result()
 
 
 if __name__ == "__main__":
@@ -2,12 +2,51 @@
 
 import re
 import os
+import contextlib
+import functools
+import json
+import threading
+import types
+import shutil
 import yaml
 import zipfile
 import hashlib
 from colorama import Fore, Style
 import config
 
+# Use the libyaml based loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Terminal formatting sequences
+_BOLD, _RED, _GREEN, _RESET = Style.BRIGHT, Fore.RED, Fore.GREEN, Style.RESET_ALL
+
+_IDENTIFIER_DROP_REVISION_RE = re.compile(r'^([^@/]+)(?:@[^/]+)?(?:/([^@]+))?$')
+_IDENTIFIER_REVISION_RE = re.compile(r'^(?:[^@/]+)(@[^/]+)?(?:/([^@]+))?$')
+_SANITIZE_RE = re.compile(r'[^a-zA-Z0-9_]')
+_DTS_INCLUDE_RE = re.compile(rb'^#include\S*[ \t]+(\S+)', re.MULTILINE)
+_DTS_INCLUDE_HEAD_SIZE = 16384
+
+# Units of the memory usage printed by Zephyr
+_MEM_UNITS = {'B': 1, 'KB': 1024, 'MB': 1024 ** 2, 'GB': 1024 ** 3}
+
+# Artifacts that would not get any smaller in a zip archive
+_COMPRESSED_SUFFIXES = ('.gz', '.xz', '.bz2', '.lz4', '.zst', '.zip')
+
+# All the caches of the scripts, kept apart from the artifacts in `build/` and from the Zephyr checkout
+CACHE_DIR = ".cache"
+
+# Generated once per pipeline by `resolve_boards.py`
+BOARD_RESOLUTION_PATH = os.path.join(CACHE_DIR, "board_resolution.json")
+
+# JSON copies of the parsed YAML files
+YAML_CACHE_DIR = os.path.join(CACHE_DIR, "yaml")
+
+# Compiled bytecode of the Jinja2 templates
+JINJA_CACHE_DIR = os.path.join(CACHE_DIR, "jinja")
+
 
 def bold(text: str) -> str:
     """
@@ -19,21 +58,21 @@ def bold(text: str) -> str:
     Returns:
         str: The input text with bold formatting.
     """
-    return Style.BRIGHT + (text or "") + Style.RESET_ALL
+    return f"{_BOLD}{text or ''}{_RESET}"
 
 
 def red(text):
     """
     Apply red color to the provided text.
     """
-    return Fore.RED + (text or "") + Style.RESET_ALL
+    return f"{_RED}{text or ''}{_RESET}"
 
 
 def green(text):
     """
     Apply green color to the provided text.
     """
-    return Fore.GREEN + (text or "") + Style.RESET_ALL
+    return f"{_GREEN}{text or ''}{_RESET}"
 
 
 def get_sample_path(sample_name: str) -> str:
@@ -46,13 +85,19 @@ def get_sample_path(sample_name: str) -> str:
     Returns:
         str: The path of the specified sample.
     """
+    # Relative paths are resolved against the current directory, which is a part of the cache key
+    return _resolve_sample_path(sample_name, os.getcwd())
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_sample_path(sample_name: str, cwd: str) -> str:
     if workspace := get_sample_workspace(sample_name):
         return os.path.realpath(f'{workspace}/{config.samples[sample_name]["path"]}')
     else:
         return os.path.realpath(f'{config.project_path}/{config.samples[sample_name]["path"]}')
 
 
-
+@functools.lru_cache(maxsize=None)
 def get_sample_workspace(sample_name: str) -> str | None:
     """
     Retrieve the sample workspace location.
@@ -66,6 +111,7 @@ def get_sample_workspace(sample_name: str) -> str | None:
     return config.samples[sample_name].get("workspace", None)
 
 
+@functools.lru_cache(maxsize=None)
 def get_sample_extra_args(sample_name: str) -> str | None:
     """
     Retrieve the sample extra arguments.
@@ -91,15 +137,58 @@ def find_node_size(node: str, dts_filename: str):
         tuple or None: A tuple containing the node name and its size as a list of values,
                        or None if the node or size information is not found in the DTS.
     """
-    with open(dts_filename) as f:
-        dts = f.read()
-    try:
-        node_name = re.search(r"zephyr,{} = &(\w+);".format(node), dts).group(1)
-        node_size = re.search(r"{}:(.*\n)*?.*reg = <(.*)>;".format(node_name), dts).group(2)
-        node_size = node_size.split()
-    except AttributeError:
+    # The DTS is scanned as bytes, it is read once for all the nodes looked up in it
+    dts = read_file_cached(dts_filename)
+
+    alias = _node_alias_pattern(node).search(dts)
+    if alias is None:
+        return None
+    node_name = alias.group(1)
+    # Bounded pattern, the label is followed by the node header and properties up to its `reg`,
+    # without crossing into child nodes
+    reg = _node_reg_pattern(node_name).search(dts)
+    if reg is None:
         return None
-    return node_name, node_size
+    node_size = reg.group(1).decode().split()
+    return node_name.decode(), node_size
+
+
+@functools.lru_cache(maxsize=64)
+def _node_alias_pattern(node: str) -> re.Pattern:
+    """
+    Compile the pattern matching the `zephyr,<node>` chosen entry of a DTS file.
+    """
+    return re.compile(rb"zephyr,%s = &(\w+);" % re.escape(node.encode()))
+
+
+@functools.lru_cache(maxsize=64)
+def _node_reg_pattern(label: bytes) -> re.Pattern:
+    """
+    Compile the pattern matching the `reg` property of the node with the given label.
+    """
+    return re.compile(rb"\b%s:[^{}]*\{[^{}]*?\breg = <([^>]*)>;" % re.escape(label))
+
+
+def read_file_cached(filename: str) -> bytes:
+    """
+    Read the contents of a file, reusing the previous read while the file is unchanged.
+
+    Args:
+        filename (str): The name of the file to read.
+
+    Returns:
+        bytes: The contents of the file.
+    """
+    # Generated files (zephyr.dts) are rewritten by the memory extension rebuilds,
+    # so the modification time and size are a part of the cache key
+    stat = os.stat(filename)
+    return _read_file(os.path.abspath(filename), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=16)
+def _read_file(filename: str, mtime_ns: int, size: int) -> bytes:
+    with open(filename, 'rb') as f:
+        return f.read()
 
 
 def decode_node(node_name, dts_filename):
@@ -134,26 +223,158 @@ def flatten(boards: dict):
     return flat_boards
 
 
-def create_zip_archive(zip_filename: str, format_args: dict, files: list) -> None:
+def create_zip_archive(zip_filename: str, paths: dict, files: list) -> None:
     """
-    Create a zip archive containing specified files based on the given format arguments.
+    Create a zip archive containing the specified artifacts.
 
     Parameters:
         zip_filename (str): The name of the zip archive to be created
-        format_args (dict): A dictionary of format arguments for building file paths
+        paths (dict): A dictionary of resolved artifact paths, keyed like 'config.artifact_paths'
         files (list): A list of artifacts to include in the zip archive
 
     Raises:
-        ValueError: If a key specified in 'files' does not occur in 'config.artifact_paths'
+        ValueError: If a key specified in 'files' does not occur in 'paths'
     """
-    with zipfile.ZipFile(zip_filename, "w", compression=zipfile.ZIP_DEFLATED) as f:
+    # Names of the files in each artifact directory, every directory is listed only once
+    dir_entries = {}
+
+    # The archived text files (SPDX) compress well even at the fastest level
+    with zipfile.ZipFile(zip_filename, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as f:
         for ftype in files:
-            if ftype in config.artifact_paths.keys():
-                fname = config.artifact_paths[ftype].format(**format_args)
+            if ftype in paths:
+                fname = paths[ftype]
             else:
                 raise ValueError(f"No {ftype} key in artifacts. Path unknown")
-            if os.path.exists(fname):
-                f.write(fname, fname.split(os.sep)[1] + os.sep + os.path.basename(fname))
+
+            dirname, basename = os.path.split(fname)
+            if dirname not in dir_entries:
+                try:
+                    with os.scandir(dirname or ".") as entries:
+                        dir_entries[dirname] = {entry.name for entry in entries}
+                except FileNotFoundError:
+                    dir_entries[dirname] = set()
+
+            if basename in dir_entries[dirname]:
+                # Already compressed files are stored as they are
+                compress_type = zipfile.ZIP_STORED if basename.endswith(_COMPRESSED_SUFFIXES) else None
+                f.write(fname, fname.split(os.sep)[1] + os.sep + basename, compress_type=compress_type)
+
+
+def publish_file(src: str, dst: str, hardlink: bool = True) -> None:
+    """
+    Publish a file under a new path, using a hardlink if possible.
+
+    Falls back to copying when the files are on different filesystems.
+    An existing destination file is replaced.
+
+    Parameters:
+        src (str): The path of the file to publish
+        dst (str): The destination path
+        hardlink (bool): Whether a hardlink may be used. Files created by `tempfile.mkstemp`
+                         are private (0600), they have to be copied to get the default permissions.
+    """
+    if os.path.lexists(dst):
+        os.remove(dst)
+
+    if hardlink:
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            pass
+
+    copy_file(src, dst)
+
+
+def copy_file(src: str, dst: str) -> None:
+    """
+    Copy the contents of a file, keeping the data inside the kernel if possible.
+
+    Uses `os.copy_file_range` (Linux), which may also create a reflink.
+    Falls back to `shutil.copyfile` if it is not available or not supported
+    for the given files.
+
+    Parameters:
+        src (str): The path of the file to copy
+        dst (str): The destination path
+    """
+    if hasattr(os, "copy_file_range"):
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            try:
+                # Pseudo files report a zero size, they are copied the regular way
+                size = remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                if size and not remaining:
+                    return
+            except OSError:
+                pass
+
+    shutil.copyfile(src, dst)
+
+
+def publish_file_with_md5(src: str, dst: str) -> str:
+    """
+    Publish a file like `publish_file` and calculate its MD5 hash.
+
+    If the file has to be copied, it is hashed while being copied,
+    so that it is read only once.
+
+    Parameters:
+        src (str): The path of the file to publish
+        dst (str): The destination path
+
+    Returns:
+        str: The MD5 hash of the file as a hexadecimal digest.
+    """
+    if os.path.lexists(dst):
+        os.remove(dst)
+
+    try:
+        os.link(src, dst)
+    except OSError:
+        pass
+    else:
+        return calculate_md5(dst)
+
+    hash_md5 = hashlib.md5()
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        for chunk in iter(lambda: fsrc.read(1 << 20), b""):
+            hash_md5.update(chunk)
+            fdst.write(chunk)
+    return hash_md5.hexdigest()
+
+
+def scan_files(directory: str, predicate):
+    """
+    Find files in a directory and its subdirectories, in the same order as `os.walk`.
+
+    Uses the file types reported by `os.scandir`, without a stat call per entry.
+    Symbolic links to directories are not followed.
+
+    Parameters:
+        directory (str): The directory to search
+        predicate (callable): Called with a file name, the file is yielded if it returns True
+
+    Yields:
+        str: Paths of the matching files
+    """
+    subdirs = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif predicate(entry.name):
+                    yield entry.path
+    except OSError:
+        return
+
+    for subdir in subdirs:
+        yield from scan_files(subdir, predicate)
 
 
 def print_frame(text: str, width: int = 80) -> None:
@@ -179,26 +400,69 @@ def calculate_md5(filename: str) -> str:
     Returns:
         str: The MD5 hash of the file as a hexadecimal digest.
     """
-    hash_md5 = hashlib.md5()
     with open(filename, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            hash_md5.update(chunk)
+        # Python 3.11+ runs the whole read and hash loop in C
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "md5").hexdigest()
+
+        hash_md5 = hashlib.md5()
+        buffer = bytearray(1 << 20)
+        view = memoryview(buffer)
+        while size := f.readinto(buffer):
+            hash_md5.update(view[:size])
     return hash_md5.hexdigest()
 
 
-def get_versions() -> dict:
+@functools.lru_cache(maxsize=1)
+def get_versions() -> types.MappingProxyType:
     """
     Retrieve versions of Zephyr, Zephyr SDK, and MicroPython from environment variables.
 
     The corresponding values are read from environment variables.
     If the environment variable is not set, the value will be "???".
+    The versions are read once, the returned mapping is read-only.
     """
     default = "???"
-    return {
+    return types.MappingProxyType({
         "zephyr": os.environ.get("ZEPHYR_VERSION", default),
         "sdk": os.environ.get("ZEPHYR_SDK_VERSION", default),
         "micropython": os.environ.get("MICROPYTHON_VERSION", default),
-    }
+    })
+
+
+@functools.lru_cache(maxsize=1)
+def get_board_resolution() -> dict:
+    """
+    Load the board resolution generated by `resolve_boards.py`.
+
+    The resolution maps board identifiers to their directory, yaml and dts files.
+    It is read once, entries resolved for a different Zephyr version are ignored.
+
+    Returns:
+        dict: Board identifiers mapped to dicts with "board_dir", "yaml" and "dts" keys,
+              empty if the resolution is not available.
+    """
+    return read_json_cache(BOARD_RESOLUTION_PATH, {"version": get_versions()["zephyr"]}) or {}
+
+
+def get_resolved_board_file(board_dir: str, board_identifier: str, kind: str) -> str | None:
+    """
+    Get a file of the board from the board resolution.
+
+    Args:
+        board_dir (str): Board directory in the Zephyr tree.
+        board_identifier (str): The board identifier.
+        kind (str): Kind of the file, "yaml" or "dts".
+
+    Returns:
+        Optional[str]: Path to the file, None if it is not resolved for this board directory or doesn't exist.
+    """
+    entry = get_board_resolution().get(board_identifier)
+    if entry is None or os.path.normpath(entry["board_dir"]) != os.path.normpath(board_dir):
+        return None
+
+    path = entry.get(kind)
+    return path if path and os.path.exists(path) else None
 
 
 def zephyr_config_to_list(config_path: str) -> list | None:
@@ -212,25 +476,184 @@ def zephyr_config_to_list(config_path: str) -> list | None:
         Optional[list]: A list of non-commented lines from the configuration file,
                         None if file doesn't exist.
     """
-    if os.path.exists(config_path):
-        with open(config_path, 'r') as cfg:
-            return [line.strip() for line in cfg if line.strip() and not line.startswith('#')]
-    else:
+    try:
+        stat = os.stat(config_path)
+    except FileNotFoundError:
         return None
 
+    # The same configuration is shared by many builds, it is parsed again only if it changes
+    return list(_parse_zephyr_config(os.path.abspath(config_path), stat.st_mtime_ns, stat.st_size))
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_zephyr_config(config_path: str, mtime_ns: int, size: int) -> tuple:
+    """
+    Parse a Zephyr configuration file, the modification time and size are only used as the cache key.
+    """
+    with open(config_path, 'rb') as cfg:
+        data = cfg.read()
+
+    # Lines are split and filtered as bytes, only the kept ones are decoded
+    lines = (line.strip() for line in data.splitlines() if not line.startswith(b'#'))
+    return tuple(line.decode() for line in lines if line)
+
+
+@functools.lru_cache(maxsize=None)
+def get_template(template_name: str):
+    """
+    Load a Jinja2 template of this repository.
+
+    Templates are static during a CI run, their compiled bytecode is kept in `JINJA_CACHE_DIR`
+    so that consecutive script invocations do not compile them again.
+    jinja2 is only imported on first use.
+
+    Args:
+        template_name (str): Path to the template, relative to the repository root.
+
+    Returns:
+        jinja2.Template: The loaded template.
+    """
+    import jinja2
+
+    os.makedirs(JINJA_CACHE_DIR, exist_ok=True)
+    template_env = jinja2.Environment(
+        loader=jinja2.FileSystemLoader(searchpath="./"),
+        auto_reload=False,
+        bytecode_cache=jinja2.FileSystemBytecodeCache(directory=JINJA_CACHE_DIR, pattern='__jinja2_%s.cache'),
+    )
+    return template_env.get_template(template_name)
+
+
+def write_json_atomic(path: str, data) -> None:
+    """
+    Write data as JSON, replacing the file atomically.
+
+    Other jobs may read the file at the same time, they see either the old or the new content.
+    The file gets the default permissions, unlike the files of `tempfile`.
+
+    Args:
+        path (str): Path of the JSON file, its directory is created if needed.
+        data (Any): Data to be written, it is serialized before the file is created.
+    """
+    content = json.dumps(data)
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temp_path, 'w') as f:
+            f.write(content)
+        os.replace(temp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(temp_path)
+        raise
+
+
+def read_json_cache(path: str, key: dict):
+    """
+    Read data stored by `write_json_cache`.
+
+    Args:
+        path (str): Path of the cache file.
+        key (dict): The key the data has to be stored with, e.g. the version or the state of the source files.
+
+    Returns:
+        Any: The stored data, None if the file is missing, unreadable or stored with a different key.
+    """
+    try:
+        with open(path) as f:
+            cached = json.load(f)
+        if cached["key"] == key:
+            return cached["data"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def write_json_cache(path: str, key: dict, data) -> bool:
+    """
+    Store data with its key for `read_json_cache`, see `write_json_atomic`.
+
+    JSON turns non-string mapping keys into strings and has no dates,
+    the data is only stored if it reads back unchanged.
+
+    Args:
+        path (str): Path of the cache file.
+        key (dict): The key to store the data with.
+        data (Any): The data to be stored.
+
+    Returns:
+        bool: True if the data was stored.
+    """
+    try:
+        if json.loads(json.dumps(data)) != data:
+            return False
+        write_json_atomic(path, {"key": key, "data": data})
+    except (OSError, TypeError, ValueError):
+        return False
+    return True
+
+
+def load_yaml_cached(yaml_filename: str):
+    """
+    Load data from a YAML file, reusing its JSON copy stored by a previous run.
+
+    Unlike `get_yaml_data`, the data is not kept in memory and may be modified by the caller.
+
+    Args:
+        yaml_filename (str): Path to the YAML file.
+
+    Returns:
+        Any: Parsed YAML data.
+    """
+    stat = os.stat(yaml_filename)
+    return _parse_yaml_cached(os.path.abspath(yaml_filename), stat.st_mtime_ns, stat.st_size)
+
 
 def get_yaml_data(yaml_filename: str):
     """
     Load data from a YAML file.
 
+    The parsed data is cached for as long as the file stays unchanged,
+    it must not be modified by the caller.
+
     Args:
         yaml_filename (str): Path to the YAML file.
 
     Returns:
         Any: Parsed YAML data.
     """
+    stat = os.stat(yaml_filename)
+    return _load_yaml_data(os.path.abspath(yaml_filename), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=256)
+def _load_yaml_data(yaml_filename: str, mtime_ns: int, size: int):
+    """
+    `_parse_yaml_cached` memoized, the modification time and size are only used as the cache key.
+    """
+    return _parse_yaml_cached(yaml_filename, mtime_ns, size)
+
+
+def _parse_yaml_cached(yaml_filename: str, mtime_ns: int, size: int):
+    """
+    Parse a YAML file with the given modification time and size.
+
+    The parsed data is also stored as JSON under `YAML_CACHE_DIR`, keyed by the YAML path.
+    JSON is read instead of parsing the YAML again while the file has the same mtime and size.
+    """
+    cache_path = os.path.join(YAML_CACHE_DIR, hashlib.sha1(yaml_filename.encode()).hexdigest() + ".json")
+    key = {"path": yaml_filename, "mtime_ns": mtime_ns, "size": size}
+    if (data := read_json_cache(cache_path, key)) is not None:
+        return data
+
     with open(yaml_filename) as f:
-        return yaml.load(f, Loader=yaml.SafeLoader)
+        data = yaml.load(f, Loader=SafeLoader)
+
+    # Data that can't be stored as JSON is parsed again next time
+    write_json_cache(cache_path, key, data)
+    return data
 
 
 def conv_zephyr_mem_usage(val: str) -> int:
@@ -243,16 +666,11 @@ def conv_zephyr_mem_usage(val: str) -> int:
     Returns:
         int: Memory usage in bytes.
     """
-    if val.endswith(' B'):
-        val = int(val[:-2])
-    elif val.endswith(' KB'):
-        val = int(val[:-3]) * 1024
-    elif val.endswith(' MB'):
-        val = int(val[:-3]) * 1024 ** 2
-    elif val.endswith(' GB'):
-        val = int(val[:-3]) * 1024 ** 3
+    number, _, unit = val.rpartition(' ')
+    if unit not in _MEM_UNITS:
+        return val
 
-    return val
+    return int(number) * _MEM_UNITS[unit]
 
 
 def identifier_drop_revision(identifier: str) -> str:
@@ -265,7 +683,7 @@ def identifier_drop_revision(identifier: str) -> str:
     Returns:
         str: Non-sanitized Zephyr board identifier without the revision.
     """
-    match = re.match(r'^([^@/]+)(?:@[^/]+)?(?:/([^@]+))?$', identifier)
+    match = _IDENTIFIER_DROP_REVISION_RE.match(identifier)
     if match:
         board_path = match.group(1)
         soc_path = match.group(2)
@@ -278,7 +696,7 @@ def identifier_get_revision(identifier: str) -> str:
     """
     Retrieve the revision from target name or empty string if no revision is specified.
     """
-    match = re.match(r'^(?:[^@/]+)(@[^/]+)?(?:/([^@]+))?$', identifier)
+    match = _IDENTIFIER_REVISION_RE.match(identifier)
     if match and match.group(1):
         return match.group(1)[1:]
     return ''
@@ -318,16 +736,20 @@ def get_dts_by_identifier(board_dir: str, board_identifier: str, board_yaml_path
         * cmake/modules/dts.cmake         - `DTS_SOURCE` variable
         * cmake/modules/extensions.cmake  - `zephyr_build_string` function
     '''
-    # Get all dts files inside the `board_dir`
-    filenames = []
-    for root, dirs, files in os.walk(board_dir):
-        for file in files:
-            if file.endswith('.dts'):
-                filenames.append(file)
+    # Use the file found by `resolve_boards.py`, if available
+    if resolved := get_resolved_board_file(board_dir, board_identifier, "dts"):
+        return resolved
+
+    return find_dts_by_identifier(board_dir, board_identifier, board_yaml_path)
 
-    # If there is only one `dts` file -> use it
-    if len(filenames) == 1:
-        return os.path.join(board_dir, filenames[0])
+
+def find_dts_by_identifier(board_dir: str, board_identifier: str, board_yaml_path: str) -> str:
+    """
+    Find the target's base `dts` file with the heuristics of `get_dts_by_identifier`,
+    without using the board resolution.
+    """
+    # Direct candidates are checked first, the `board_dir` is only walked if none of them exists.
+    # An existing candidate is also the only `dts` file, if there is just one.
 
     # Most of the time the time `.dts` basename is the same as the coresponding `.yaml` file basename, for example:
     # nucleo_h745zi_q_stm32h745xx_m4.yaml -> nucleo_h745zi_q_stm32h745xx_m4.dts
@@ -335,7 +757,7 @@ def get_dts_by_identifier(board_dir: str, board_identifier: str, board_yaml_path
     if os.path.exists(dts_candidate_from_yaml_name):
         return dts_candidate_from_yaml_name
 
-    # Multiple `dts` files and no direct match has been made. Attempt to match _closest_ `dts` file
+    # No direct match has been made. Attempt to match _closest_ `dts` file
     # 1. Remove `BOARD_REVISION` from the target identifier
     # 2. Create a list of possible `dts` filenames, with decreasing specificity (the `.dts` suffix is added to the end of each list)
     # 3. Check if a `dts` file with the decreased specificity exists
@@ -352,9 +774,20 @@ def get_dts_by_identifier(board_dir: str, board_identifier: str, board_yaml_path
 
     for dts_candidate in possible_dts_filenames:
         full_path = os.path.join(board_dir, dts_candidate)
-        if dts_candidate in filenames and os.path.exists(full_path):
+        if os.path.exists(full_path):
             return full_path
 
+    # Get all dts files inside the `board_dir`
+    filenames = []
+    for root, dirs, files in os.walk(board_dir):
+        for file in files:
+            if file.endswith('.dts'):
+                filenames.append(file)
+
+    # If there is only one `dts` file -> use it
+    if len(filenames) == 1:
+        return os.path.join(board_dir, filenames[0])
+
     # All heuristics have failed!
     # Return any `dts` file as a failsafe, None if no `dts` files have been found.
     if filenames:
@@ -364,40 +797,67 @@ def get_dts_by_identifier(board_dir: str, board_identifier: str, board_yaml_path
         return ""
 
 
-def get_dts_include_chain(arch: str, dts_filename: str, chain=[]) -> list:
+def get_dts_include_chain(arch: str, dts_filename: str, chain: tuple = ()) -> list:
     """
-    Recursively read .dts file to retrieve the CPU dependency chain.
+    Read .dts files to retrieve the CPU dependency chain, following the first include of each file.
 
     Args:
         arch (str): The target CPU architecture.
         dts_filename (str): The name of the .dts file to be parsed.
-        chain (list): A list for keeping track of the dependencies.
+        chain (tuple): The dependencies found so far, the chain is extended with the new ones.
 
     Returns:
         list: Contains the name(s) of the CPU as determined from the .dts file(s).
     """
-    next_include = ''
-    if os.path.exists(dts_filename):
-        with open(dts_filename) as f:
-            dts_file = f.readlines()
-        for line in dts_file:
-            if next_include == '' and line.startswith('#include'):
-                _, next_include = line.split()
-                local = not (next_include.startswith('<') and next_include.endswith('>'))
-                next_include = next_include.strip(' "<>')
-                name, extension = os.path.splitext(next_include)
-                if extension.strip('.') == 'h':
-                    next_include = ''
-                    continue
-                if local:
-                    dtsi_filename = f'{os.path.dirname(dts_filename)}/{next_include}'
-                    name = '!' + name
-                else:
-                    dtsi_filename = f'{config.project_path}/dts/{arch}/{next_include}'
-                return get_dts_include_chain(arch, dtsi_filename, chain + [name])
+    chain = list(chain)
+    while os.path.exists(dts_filename):
+        with open(dts_filename, 'rb') as f:
+            # Includes are at the top of the file, read the rest only if the head has no .dtsi include
+            head = f.read(_DTS_INCLUDE_HEAD_SIZE)
+            rest = b''
+            if len(head) == _DTS_INCLUDE_HEAD_SIZE:
+                # Search only the complete lines, the last one continues in the rest of the file
+                cut = head.rfind(b'\n') + 1
+                head, rest = head[:cut], head[cut:]
+
+            include = _find_dts_include(head)
+            if include is None:
+                include = _find_dts_include(rest + f.read())
+
+        if include is None:
+            return chain
+
+        name, next_include, local = include
+        if local:
+            dts_filename = f'{os.path.dirname(dts_filename)}/{next_include}'
+            name = '!' + name
+        else:
+            dts_filename = f'{config.project_path}/dts/{arch}/{next_include}'
+        chain.append(name)
     return chain
 
 
+def _find_dts_include(content: bytes) -> tuple | None:
+    """
+    Find the first include of a DTS file that is not a header (.h).
+
+    Args:
+        content (bytes): Complete lines of the DTS file.
+
+    Returns:
+        tuple | None: The included name without extension, the included path and whether
+                      the include is local (quoted), None if there is no such include.
+    """
+    for include in _DTS_INCLUDE_RE.findall(content):
+        next_include = include.decode()
+        local = not (next_include.startswith('<') and next_include.endswith('>'))
+        next_include = next_include.strip(' "<>')
+        name, extension = os.path.splitext(next_include)
+        if extension.strip('.') != 'h':
+            return name, next_include, local
+    return None
+
+
 def sanitize_lower(string: str) -> str:
     """
     Sanitize the string, so that the string only contains alpha-numeric
@@ -411,4 +871,4 @@ def sanitize_lower(string: str) -> str:
     Returns:
         str: Sanitized and lower-cased string.
     """
-    return re.sub(r'[^a-zA-Z0-9_]', '_', string).lower()
+    return _SANITIZE_RE.sub('_', string).lower()
@@ -1,4 +1,3 @@
-import yaml
 from argparse import ArgumentParser
 
 # these project-specific values are loaded from the --config YAML
@@ -19,8 +18,7 @@ def load(config_path=None):
         args, _ = ap.parse_known_args()
         config_path = args.config
 
-    with open(config_path) as f:
-        config = yaml.safe_load(f)
+    config = _parse(config_path)
 
     for key in config:
         hidden_key = "_" + key
@@ -34,6 +32,17 @@ def load(config_path=None):
     _loaded = True
 
 
+def _parse(config_path):
+    """
+    Parse the config YAML, reusing its JSON copy while the file is unchanged.
+
+    The config is parsed by every script of every job, the JSON copy is much faster to load.
+    """
+    # `common` imports this module, import it only once both are initialized
+    from common import load_yaml_cached
+    return load_yaml_cached(config_path)
+
+
 def __getattr__(name):
     if not _loaded:
         raise ValueError(f"Tried to get config attribute {name} without loaded config")
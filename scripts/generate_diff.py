@@ -7,6 +7,9 @@ from common import (
     bold
 )
 
+# Shared by all requests, keeps the connection to the storage alive between them
+_session = requests.Session()
+
 
 def get_remote_json(version: str | None = None) -> dict:
     """
@@ -19,12 +22,11 @@ def get_remote_json(version: str | None = None) -> dict:
         dict: The retrieved JSON as a dictionary.
     """
     BASE = "https://storage.googleapis.com/zephyr-samples-builder/zephyr"
-    s = requests.Session()
 
     if version is None:
-        version = s.get(f"{BASE}/latest").text.strip()
+        version = _session.get(f"{BASE}/latest").text.strip()
 
-    return s.get(f"{BASE}/{version}/result.json").json()
+    return _session.get(f"{BASE}/{version}/result.json").json()
 
 
 def json_sample_diff(sample: str, remote_json: dict, local_json: dict) -> tuple[dict, dict, dict]:
@@ -39,29 +41,40 @@ def json_sample_diff(sample: str, remote_json: dict, local_json: dict) -> tuple[
     Returns:
         tuple[dict, dict, dict]: A tuple containing dictionaries of changed, added and removed elements.
     """
-    changed = {}
-    added = {}
-    removed = {}
+    return json_samples_diff([sample], remote_json, local_json)[sample]
+
+
+def json_samples_diff(samples: list, remote_json: dict, local_json: dict) -> dict[str, tuple[dict, dict, dict]]:
+    """
+    Compares local and remote JSON for all samples at once, in a single pass over the targets.
+
+    Args:
+        samples (list): The samples to compare for.
+        remote_json (dict): The remote JSON structure.
+        local_json (dict): The local JSON structure.
+
+    Returns:
+        dict[str, tuple[dict, dict, dict]]: Samples mapped to tuples containing dictionaries
+        of changed, added and removed elements.
+    """
+    diffs = {sample: ({}, {}, {}) for sample in samples}
     for target in remote_json.keys() | local_json.keys():
-        try:
-            remote_status = remote_json[target]["samples"][sample]
-        except KeyError:
-            remote_status = None
+        remote_samples = remote_json.get(target, {}).get("samples", {})
+        local_samples = local_json.get(target, {}).get("samples", {})
 
-        try:
-            local_status = local_json[target]["samples"][sample]
-        except KeyError:
-            local_status = None
+        for sample, (changed, added, removed) in diffs.items():
+            remote_status = remote_samples.get(sample)
+            local_status = local_samples.get(sample)
 
-        if local_status != remote_status:
-            category = added if remote_status is None else removed if local_status is None else changed
-            category[target] = (remote_status, local_status)
+            if local_status != remote_status:
+                category = added if remote_status is None else removed if local_status is None else changed
+                category[target] = (remote_status, local_status)
 
-    return changed, added, removed
+    return diffs
 
 
 def main() -> None:
-    with open("build/result.json", "r") as f:
+    with open("build/result.json", "r", encoding="utf-8") as f:
         local_results = json.load(f)
 
     try:
@@ -70,8 +83,9 @@ def main() -> None:
         print(f'Failed to get remote JSON, quitting!\n{e}')
         exit(0)
 
-    for sample in config.samples:
-        changed, added, removed = json_sample_diff(sample, remote_results, local_results)
+    diffs = json_samples_diff(list(config.samples), remote_results, local_results)
+
+    for sample, (changed, added, removed) in diffs.items():
 
         print(80 * '-')
         if all(not var for var in (changed, added, removed)):
@@ -1,16 +1,43 @@
 #!/usr/bin/env python3
 
 import csv
+import functools
+import itertools
+import operator
 import os
 import json
+import re
+import sys
 import config
-import jinja2
-from common import get_versions
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from common import get_template, get_versions, scan_files
 
-# Setup Jinja2 environment
-template_loader = jinja2.FileSystemLoader(searchpath="./")
-template_env = jinja2.Environment(loader=template_loader)
-summary_template = template_env.get_template("templates/summary.md")
+# Use orjson when it is installed, it decodes and encodes the results much faster
+# The fallback encoder produces the same compact UTF-8 output as orjson
+try:
+    import orjson
+    json_loads = orjson.loads
+
+    def json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    json_loads = json.loads
+    json_dumps = functools.partial(json.dumps, separators=(",", ":"), ensure_ascii=False)
+
+# The CSV files are written in large blocks
+CSV_BUFFER_SIZE = 1 << 20
+
+# Pretty names of the architecture DTS files, at the end of the include chain
+_SOC_ARCH_NAMES = {
+    'arm/armv': 'Arm v',
+    'arm64/armv': 'Arm v',
+    'xtensa/xtensa': 'Xtensa'
+}
+_SOC_ARCH_RE = re.compile('|'.join(re.escape(name) for name in _SOC_ARCH_NAMES))
+
+# Fields repeated across thousands of results and used as dict keys when they are aggregated
+_INTERNED_FIELDS = ('sample_name', 'platform', 'platform_full_name', 'arch')
 
 
 def aggregate_json_files(directory: str) -> list:
@@ -23,15 +50,36 @@ def aggregate_json_files(directory: str) -> list:
     Returns:
         list: List of aggregated JSON data
     """
-    aggregated_data = []
-    for root, _, files in os.walk(directory):
-        for file in files:
-            if file.endswith("-result.json"):
-                file_path = os.path.join(root, file)
-                with open(file_path, "r") as f:
-                    data = json.load(f)
-                    aggregated_data.append(data)
-    return aggregated_data
+    # Reading the files is I/O bound, load them in parallel (the order is preserved)
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        return list(executor.map(load_json_file, scan_files(directory, lambda name: name.endswith("-result.json"))))
+
+
+def load_json_file(file_path: str):
+    """
+    Load data from a JSON file
+
+    Args:
+        file_path (str): Path to the JSON file
+
+    Returns:
+        Any: Parsed JSON data
+    """
+    # The result files are small, read them whole without creating a buffered file object
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        data = os.read(fd, os.fstat(fd).st_size or 65536)
+        while chunk := os.read(fd, 65536):
+            data += chunk
+    finally:
+        os.close(fd)
+
+    result = json_loads(data)
+    if isinstance(result, dict):
+        for key in _INTERNED_FIELDS:
+            if isinstance(value := result.get(key), str):
+                result[key] = sys.intern(value)
+    return result
 
 
 def generate_stats(data: list) -> dict:
@@ -77,50 +125,52 @@ def process_sample_data(aggregated_jsons: list) -> dict:
         dict: A dictionary where keys are sample names and values are lists of build result items
             sorted by 'platform' value within each list.
     """
-    sample_dict = {}
-
-    # Generate and fill dict keys
+    # Samples keep the order in which they first appear in the results
+    sample_order = {}
     for build_result in aggregated_jsons:
-        sample_name = build_result['sample_name']
-        if sample_name not in sample_dict:
-            sample_dict[sample_name] = []
-        sample_dict[sample_name].append(build_result)
+        sample_order.setdefault(build_result['sample_name'], len(sample_order))
 
-    # Sort the items in each list by 'platform'
-    for sample_name, items in sample_dict.items():
-        sample_dict[sample_name] = sorted(items, key=lambda x: x['platform'])
-
-    return sample_dict
+    # Sort once by sample and 'platform', then split the sorted list into the samples
+    ordered = sorted(aggregated_jsons, key=lambda x: (sample_order[x['sample_name']], x['platform']))
+    return {sample_name: list(items) for sample_name, items in itertools.groupby(ordered, key=operator.itemgetter('sample_name'))}
 
 
 def soc_info(dts_chain):
     if not dts_chain and not len(dts_chain):
         return ''
 
-    dts_chain_filtered = [el.lstrip('!') for el in dts_chain if "!skeleton" not in el]  # remove all '!skeleton' entries, strip every '!' from other
-    dts_chain_filtered = list(dict.fromkeys(dts_chain_filtered))  # delete duplicates
-
-    r = {
-        'arm/armv': 'Arm v',
-        'arm64/armv': 'Arm v',
-        'xtensa/xtensa': 'Xtensa'
-    }
+    # Single pass: remove all '!skeleton' entries, strip every '!' from other and delete duplicates
+    seen = set()
+    dts_chain_filtered = []
+    for el in dts_chain:
+        if "!skeleton" in el:
+            continue
+        el = el.lstrip('!')
+        if el not in seen:
+            seen.add(el)
+            dts_chain_filtered.append(el)
 
     if not dts_chain_filtered:
         return ''
 
-    for k, v in r.items():
-        if k in dts_chain_filtered[-1]:
-            dts_chain_filtered[-1] = dts_chain_filtered[-1].replace(k, v)
+    cpu = _SOC_ARCH_RE.sub(lambda m: _SOC_ARCH_NAMES[m.group(0)], dts_chain_filtered[-1])
 
     if len(dts_chain_filtered) == 1:
-        dts_cpu_info = dts_chain_filtered[0]
+        dts_cpu_info = cpu
     else:
-        dts_cpu_info = f'{dts_chain_filtered[-1]} {dts_chain_filtered[0]}'
+        dts_cpu_info = f'{cpu} {dts_chain_filtered[0]}'
 
     return dts_cpu_info
 
 
+@functools.lru_cache(maxsize=None)
+def cached_soc_info(dts_chain: tuple):
+    """
+    `soc_info` memoized by the include chain, the boards of a SoC family share the same chain.
+    """
+    return soc_info(dts_chain)
+
+
 def collective_result(aggregated_results: list):
     """
     Process aggregated build result into a single dict organized by board names.
@@ -128,33 +178,31 @@ def collective_result(aggregated_results: list):
     collective = dict()
 
     # Find duplicated board names.
-    names = set()
-    duplicates = set()
-    for result in aggregated_results:
-        if result["sample_name"] != "hello_world":
-            continue
-        name = result["platform_full_name"]
-        if name in names:
-            duplicates.add(name)
-        names.add(name)
-    del names
+    name_counts = Counter(result["platform_full_name"] for result in aggregated_results if result["sample_name"] == "hello_world")
+    duplicates = {name for name, count in name_counts.items() if count > 1}
 
     for result in aggregated_results:
         sample_name = result["sample_name"]
         platform = result["platform"]
-        soc = ''
-        if dts_chain := result.get('dts_include_chain'):
-            soc = soc_info(dts_chain)
-
-        # If the pretty name is not unique, append its revision.
-        if result["platform_full_name"] in duplicates:
-            result["platform_full_name"] += ' ' + (result.get("platform_revision") or '')
 
-        if platform not in collective:
-            collective[platform] = dict(
+        # Look the platform up once, the entry is only built for its first result
+        platform_entry = collective.get(platform)
+        if platform_entry is None:
+            # The SoC is described once per platform, by its first result
+            soc = ''
+            if dts_chain := result.get('dts_include_chain'):
+                soc = cached_soc_info(tuple(dts_chain))
+
+            # If the pretty name is not unique, append its revision.
+            # The result itself is not modified, it may be aggregated again.
+            name = result["platform_full_name"]
+            if name in duplicates:
+                name += ' ' + (result.get("platform_revision") or '')
+
+            platform_entry = collective[platform] = dict(
                     arch=result["arch"],
                     arch_bits = result["arch_bits"],
-                    name=result["platform_full_name"],
+                    name=name,
                     soc=soc,
                     samples=dict())
 
@@ -163,7 +211,7 @@ def collective_result(aggregated_results: list):
             extended_memory=result["extended_memory"],
         )
 
-        collective[platform]["samples"][sample_name] = sample_entry
+        platform_entry["samples"][sample_name] = sample_entry
 
     return collective
 
@@ -172,16 +220,18 @@ def collective_json_result(aggregated_results: list) -> str:
     """
     Process aggregated build result into a single JSON organized by board names.
     """
-    return json.dumps(collective_result(aggregated_results))
+    return json_dumps(collective_result(aggregated_results))
 
 
 def minimal_csv_result(aggregated_results: list):
-    return [[
-        elem['platform'],
-        elem['sample_name'],
-        1 if elem['success'] else 0,
-        1 if elem['extended_memory'] else 0
-    ] for elem in aggregated_results]
+    # Rows are generated while they are written, the whole table is never built
+    for elem in aggregated_results:
+        yield (
+            elem['platform'],
+            elem['sample_name'],
+            int(elem['success']),
+            int(elem['extended_memory']),
+        )
 
 
 def board_info_csv(collective_result):
@@ -204,18 +254,18 @@ def main():
     # Data for markdown table
     stats = generate_stats(summary_data)
 
-    with open('build/result.csv', 'w') as res_csv:
+    with open('build/result.csv', 'w', newline='', buffering=CSV_BUFFER_SIZE) as res_csv:
         writer = csv.writer(res_csv)
         writer.writerows(minimal_csv_result(summary_data))
 
-    with open('build/boards.csv', 'w') as boards_csv:
+    with open('build/boards.csv', 'w', newline='', buffering=CSV_BUFFER_SIZE) as boards_csv:
         writer = csv.writer(boards_csv)
         writer.writerows(board_info_csv(collective_result(summary_data)))
 
     sample_data = process_sample_data(summary_data)
 
     # Render the table
-    rendered = summary_template.render(versions=versions, stats=stats, sample_data=sample_data)
+    rendered = get_template("templates/summary.md").render(versions=versions, stats=stats, sample_data=sample_data)
     print(rendered)
 
 
@@ -1,8 +1,123 @@
 #!/usr/bin/env python3
 
 import os
+import re
 import yaml
 import config
+from common import CACHE_DIR, SafeLoader, read_json_cache, scan_files, write_json_cache
+
+# Boards parsed by a previous run, reused while none of the board YAML files changed
+BOARDS_CACHE_PATH = os.path.join(CACHE_DIR, "boards.json")
+
+# Lines of the flat board YAML files, anything else is left to the YAML loader:
+# a plain value without indicators, tabs, comments or non-ASCII characters
+_YAML_SCALAR = rb"[A-Za-z0-9_./(][^\x00-\x1f\x7f-\xff:#'\"{}\[\],&*!|>%@`]*"
+# a top-level `key: value`, or a `key:` opening a block
+_YAML_KEY_LINE_RE = re.compile(rb'([A-Za-z_][A-Za-z0-9_-]*):(?: +(' + _YAML_SCALAR + rb'))? *')
+# a `- value` item of a block sequence
+_YAML_ITEM_LINE_RE = re.compile(rb'( *)- +' + _YAML_SCALAR + rb' *')
+# an empty line, or a comment without control or non-ASCII characters
+_YAML_EMPTY_LINE_RE = re.compile(rb' *(?:#[\t\x20-\x7e]*)?')
+# Plain values that YAML always loads as strings, when they are not a keyword
+_BOARD_VALUE_RE = re.compile(rb'[A-Za-z_][A-Za-z0-9_./+-]*')
+# Plain values that YAML loads as booleans or null
+_YAML_KEYWORDS = {b'yes', b'no', b'true', b'false', b'on', b'off', b'null'}
+# Plain values that YAML loads as timestamps
+_YAML_TIMESTAMP_RE = re.compile(rb'\d{4}-')
+
+
+def _scan_board_yaml(data: bytes) -> dict | None:
+    """
+    Extract the identifier and arch of a board YAML file without parsing it.
+
+    Only files made of top-level keys with plain values or sequences of plain values are scanned,
+    every line has to be accounted for. Returns None for any other file, or when the identifier
+    or arch is missing, repeated or not a plain string, in that case the file has to be parsed.
+    """
+    if b'\r' in data:
+        return None
+
+    fields = {}
+    block_open = False
+    item_indent = None
+    for line in data.split(b'\n'):
+        if match := _YAML_KEY_LINE_RE.fullmatch(line):
+            key, value = match.groups()
+            if key in (b'identifier', b'arch'):
+                if key in fields or value is None:
+                    return None
+                value = value.rstrip(b' ')
+                if not _BOARD_VALUE_RE.fullmatch(value) or value.lower() in _YAML_KEYWORDS:
+                    return None
+                fields[key] = value.decode()
+            elif value is not None and _YAML_TIMESTAMP_RE.match(value):
+                return None
+            block_open = value is None
+            item_indent = None
+        elif match := _YAML_ITEM_LINE_RE.fullmatch(line):
+            # Items belong to the block opened by the last key, all at the same indentation
+            indent = len(match.group(1))
+            if not block_open or item_indent not in (None, indent):
+                return None
+            item_indent = indent
+        elif not _YAML_EMPTY_LINE_RE.fullmatch(line):
+            return None
+
+    if len(fields) != 2:
+        return None
+    return fields
+
+
+def _boards_signature(file_paths: list) -> list:
+    """
+    Signature of the board YAML files, changes when any of them is added, removed, moved or modified.
+
+    Lists the path, mtime and size of every file, in the order in which they are parsed.
+    """
+    signature = []
+    for path in file_paths:
+        st = os.stat(path)
+        signature.append([path, st.st_mtime_ns, st.st_size])
+    return signature
+
+
+def _parse_board_yaml(file_path: str) -> list:
+    """
+    Parse a board YAML file into a `[path, identifier, arch, error]` record.
+
+    Missing keys are stored as None, `error` holds the message of a YAML error.
+    """
+    # Board files are flat, the two fields can usually be read without parsing the YAML
+    with open(file_path, 'rb') as f:
+        fields = _scan_board_yaml(f.read())
+    if fields is not None:
+        return [file_path, fields[b'identifier'], fields[b'arch'], None]
+
+    with open(file_path, 'r') as f:
+        try:
+            data = yaml.load(f, Loader=SafeLoader)
+        except yaml.YAMLError as e:
+            return [file_path, None, None, str(e)]
+    try:
+        identifier = data['identifier']
+    except KeyError:
+        return [file_path, None, None, None]
+    return [file_path, identifier, data['arch'] if 'arch' in data else None, None]
+
+
+def _load_board_yamls(directory: str) -> list:
+    """
+    Parse all board YAML files in the directory, reusing the results cached
+    by a previous run when the files have not changed since.
+    """
+    file_paths = list(scan_files(directory, lambda name: name.endswith('.yaml')))
+    key = {"directory": os.path.abspath(directory), "signature": _boards_signature(file_paths)}
+    if (boards := read_json_cache(BOARDS_CACHE_PATH, key)) is not None:
+        return boards
+
+    boards = [_parse_board_yaml(file_path) for file_path in file_paths]
+    write_json_cache(BOARDS_CACHE_PATH, key, boards)
+    return boards
 
 
 def get_yaml_identifiers(directory: str, filter_archs: list | None = None, filter_targets: list | None = None, suppress_output=True) -> dict:
@@ -10,24 +125,25 @@ def get_yaml_identifiers(directory: str, filter_archs: list | None = None, filte
         if not suppress_output:
             print(*a, **k)
 
+    # One regex scan per identifier, instead of a substring search per omitted target
+    targets_re = re.compile('|'.join(map(re.escape, filter_targets))) if filter_targets else None
+
     all_boards = {}
-    for root, dirs, files in os.walk(directory):
-        for file in files:
-            if file.endswith('.yaml'):
-                file_path = os.path.join(root, file)
-                with open(file_path, 'r') as f:
-                    try:
-                        data = yaml.safe_load(f)
-                        identifier = data['identifier']
-                        if filter_archs and data['arch'] in filter_archs:
-                            continue
-                        if filter_targets and any(target in identifier for target in filter_targets):
-                            continue
-                        all_boards[identifier] = root
-                    except yaml.YAMLError as e:
-                        dprint(f"Error reading {file_path}: {e}")
-                    except KeyError as e:
-                        dprint(f"KeyError in: {file_path}: {e}")
+    for file_path, identifier, arch, error in _load_board_yamls(directory):
+        if error is not None:
+            dprint(f"Error reading {file_path}: {error}")
+            continue
+        if identifier is None:
+            dprint(f"KeyError in: {file_path}: {KeyError('identifier')}")
+            continue
+        if filter_archs and arch is None:
+            dprint(f"KeyError in: {file_path}: {KeyError('arch')}")
+            continue
+        if filter_archs and arch in filter_archs:
+            continue
+        if targets_re and targets_re.search(identifier):
+            continue
+        all_boards[identifier] = os.path.dirname(file_path)
     return all_boards
 
 
@@ -42,10 +158,16 @@ def generate_samples_from_yaml() -> None:
     omit_target = ["nsim", "xenvm", "xt-sim", "fvp_"]
     directory_path = f'{config.project_path}/boards'
     identifiers = get_yaml_identifiers(directory_path, omit_arch, omit_target)
+
+    # Boards allowed for each sample, None if the sample is built for all boards
+    sample_filters = {
+        sample: set(sample_data["boards"]) if "boards" in sample_data else None
+        for sample, sample_data in config.samples.items()
+    }
+
     for board, dir in identifiers.items():
-        for sample, sample_data in config.samples.items():
-            sample_boards = sample_data.get("boards", [board])
-            if board in sample_boards:
+        for sample, sample_boards in sample_filters.items():
+            if sample_boards is None or board in sample_boards:
                 print(f"{dir} {board} {sample}")
 
 
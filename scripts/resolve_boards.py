@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+
+import os
+import yaml
+import config
+from common import (
+    BOARD_RESOLUTION_PATH,
+    SafeLoader,
+    find_dts_by_identifier,
+    get_versions,
+    write_json_cache,
+)
+
+
+def resolve_boards(directory: str) -> dict:
+    """
+    Find the yaml and dts files of all boards inside `directory`.
+
+    Args:
+        directory (str): The Zephyr boards directory.
+
+    Returns:
+        dict: Board identifiers mapped to dicts with "board_dir", "yaml" and "dts" keys.
+    """
+    boards = {}
+    for root, dirs, files in os.walk(directory):
+        for file in files:
+            if file.endswith('.yaml'):
+                yaml_path = os.path.join(root, file)
+                with open(yaml_path, 'r') as f:
+                    try:
+                        identifier = yaml.load(f, Loader=SafeLoader)['identifier']
+                    except (yaml.YAMLError, KeyError, TypeError):
+                        continue
+                boards[identifier] = {
+                    "board_dir": root,
+                    "yaml": yaml_path,
+                    "dts": find_dts_by_identifier(root, identifier, yaml_path),
+                }
+    return boards
+
+
+def save_board_resolution(boards: dict) -> None:
+    """
+    Save the board resolution for the builds, for the current Zephyr version.
+
+    Args:
+        boards (dict): Board resolution, as returned by `resolve_boards`.
+    """
+    if not write_json_cache(BOARD_RESOLUTION_PATH, {"version": get_versions()["zephyr"]}, boards):
+        raise OSError(f"Unable to save the board resolution {BOARD_RESOLUTION_PATH}")
+
+
+if __name__ == "__main__":
+    config.load()
+    boards = resolve_boards(f'{config.project_path}/boards')
+    save_board_resolution(boards)
+    print(f"Resolved {len(boards)} boards into {BOARD_RESOLUTION_PATH}")